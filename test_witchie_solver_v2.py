@@ -0,0 +1,171 @@
+"""
+Testes de regressão do Witchie Solver V2.
+
+Execução:
+    python3 -m unittest test_witchie_solver_v2
+"""
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from witchie_solver_v2 import WitchieSolverV2
+from witchie_solver_levels_v2 import load_predefined_level, parse_level
+from witchie_solver_generator_v2 import generate_level
+import witchie_solver_cli_v2
+
+# Nível em que duas posições do jogador têm a mesma menor casa alcançável, mas
+# regiões alcançáveis diferentes (deslizar nem sempre pode ser desfeito)
+ONE_WAY_SLIDE_LEVEL = """
+⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️
+⬛️ 🙋🏿 📦 ⬜️ 🔯 ⬜️ ⬜️ ⬛️
+⬛️ ⬜️ ⬛️ 🔯 ⬜️ ⬜️ ⬜️ ⬛️
+⬛️ ⬜️ ⬜️ ⬜️ ⬛️ ⬜️ ⬜️ ⬛️
+⬛️ ⬛️ ⬜️ 📦 ⬜️ ⬛️ ⬜️ ⬛️
+⬛️ ⬛️ ⬜️ ⬜️ ⬛️ ⬜️ ⬜️ ⬛️
+⬛️ ⬛️ ⬜️ ⬜️ ⬛️ ⬜️ ⬜️ ⬛️
+⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️ ⬛️
+"""
+
+def solve_quietly(level_map, level_offset, method):
+    """
+    Executa um método de solução sem imprimir o resumo da busca.
+
+    Args:
+        level_map (list): Lista de strings representando o mapa do nível
+        level_offset (int): Largura do nível (número de colunas)
+        method (str): Nome do método de WitchieSolverV2 (por exemplo, "solve_bfs")
+
+    Returns:
+        tuple: (solver, número de movimentos, caminho)
+    """
+    solver = WitchieSolverV2(level_map, level_offset)
+    moves_count, path = getattr(solver, method)(time_limit=30, verbose=False)
+    return solver, moves_count, path
+
+class PushSearchTest(unittest.TestCase):
+    def assert_valid_solution(self, solver, path):
+        state = solver.level_map.copy()
+        state, _ = solver.apply_path(state, solver.start_position, path)
+        self.assertTrue(solver.is_level_completed(state))
+
+    def test_one_way_slides(self):
+        level_map, level_offset = parse_level(ONE_WAY_SLIDE_LEVEL)
+        solver, moves_count, path = solve_quietly(level_map, level_offset, "solve_push_search")
+        self.assertIsNotNone(moves_count)
+        self.assert_valid_solution(solver, path)
+
+    def test_solves_whenever_bfs_does(self):
+        for index in range(150):
+            seed = f"1:{index}"
+            level_map, level_offset, _, _ = generate_level(seed)
+            if level_map is None:
+                continue
+            with self.subTest(seed=seed):
+                _, bfs_moves, _ = solve_quietly(level_map, level_offset, "solve_bfs")
+                solver, moves_count, path = solve_quietly(level_map, level_offset, "solve_push_search")
+                if bfs_moves is not None:
+                    self.assertIsNotNone(moves_count)
+                    self.assert_valid_solution(solver, path)
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.level_map, self.level_offset = load_predefined_level(1)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint_path = os.path.join(directory.name, "checkpoint.json.gz")
+
+    def test_resumed_a_star_matches_uninterrupted_run(self):
+        _, expected_moves, expected_path = solve_quietly(self.level_map, self.level_offset, "solve_a_star")
+
+        solver = WitchieSolverV2(self.level_map, self.level_offset)
+        moves_count, _ = solver.solve_a_star(time_limit=0.02, checkpoint_path=self.checkpoint_path,
+                                             verbose=False)
+        self.assertIsNone(moves_count)
+        self.assertTrue(solver.is_checkpoint_for(self.checkpoint_path, "a_star"))
+        self.assertFalse(solver.is_checkpoint_for(self.checkpoint_path, "bfs"))
+
+        resumed = WitchieSolverV2(self.level_map, self.level_offset)
+        moves_count, path = resumed.solve_a_star(resume_from=self.checkpoint_path, verbose=False)
+        self.assertEqual((moves_count, path), (expected_moves, expected_path))
+
+    def test_resumed_bfs_matches_uninterrupted_run(self):
+        _, expected_moves, expected_path = solve_quietly(self.level_map, self.level_offset, "solve_bfs")
+
+        solver = WitchieSolverV2(self.level_map, self.level_offset)
+        moves_count, _ = solver.solve_bfs(checkpoint_path=self.checkpoint_path, max_nodes=1000, verbose=False)
+        self.assertIsNone(moves_count)
+
+        resumed = WitchieSolverV2(self.level_map, self.level_offset)
+        moves_count, path = resumed.solve_bfs(resume_from=self.checkpoint_path, verbose=False)
+        self.assertEqual((moves_count, path), (expected_moves, expected_path))
+
+    def test_truncated_checkpoint_raises_value_error(self):
+        solver = WitchieSolverV2(self.level_map, self.level_offset)
+        solver.solve_bfs(checkpoint_path=self.checkpoint_path, max_nodes=1000, verbose=False)
+        with open(self.checkpoint_path, "rb") as f:
+            data = f.read()
+        with open(self.checkpoint_path, "wb") as f:
+            f.write(data[:len(data) // 2])
+
+        with self.assertRaises(ValueError):
+            solver.load_checkpoint(self.checkpoint_path, "bfs")
+
+class CommandLineTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def run_cli(self, *argv):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            exit_code = witchie_solver_cli_v2.main(list(argv))
+        return exit_code, stdout.getvalue()
+
+    def test_unknown_symbol_is_an_error(self):
+        level_path = os.path.join(self.directory, "nivel.txt")
+        with open(level_path, "w", encoding="utf-8") as f:
+            # "⬛" sem o seletor de variação U+FE0F não é a parede do jogo
+            f.write("⬛ ⬛ ⬛\n⬛ 🙋🏿 ⬛\n")
+
+        self.assertEqual(self.run_cli(level_path), (2, ""))
+
+    def test_corrupted_checkpoint_is_an_error(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            level_map, level_offset = load_predefined_level(1)
+        header = {
+            "version": WitchieSolverV2.CHECKPOINT_VERSION,
+            "algorithm": "a_star",
+            "level_map": level_map,
+            "level_offset": level_offset,
+        }
+        checkpoint_path = os.path.join(self.directory, "checkpoint.json.gz")
+        with gzip.open(checkpoint_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(header) + "\n")
+
+        self.assertEqual(self.run_cli("--level-number", "1", "--resume", checkpoint_path), (2, ""))
+
+    def test_a_star_is_not_reported_optimal(self):
+        exit_code, output = self.run_cli("--level-number", "1")
+        self.assertEqual(exit_code, 0)
+        self.assertFalse(json.loads(output)["optimal"])
+
+class DecompositionTest(unittest.TestCase):
+    def test_group_solvers_skip_layout_cache(self):
+        level_map, level_offset, _, _ = generate_level("1:0", rows=10, cols=12, boxes=3, wall_density=0.3)
+        solver = WitchieSolverV2(level_map, level_offset)
+        groups = solver.find_independent_groups()
+        self.assertGreater(len(groups), 1)
+        cached = set(WitchieSolverV2._layout_cache)
+        state = level_map.copy()
+        for zone in groups:
+            solver.solve_group(state, solver.start_position, zone, 5)
+        self.assertEqual(set(WitchieSolverV2._layout_cache), cached)
+
+if __name__ == "__main__":
+    unittest.main()
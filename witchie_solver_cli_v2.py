@@ -0,0 +1,190 @@
+"""
+Interface de linha de comando não interativa do Witchie Solver V2.
+
+Exemplos:
+    python3 witchie_solver_cli_v2.py nivel.txt
+    python3 witchie_solver_cli_v2.py --level-number 2 --algorithm push --format text
+    cat nivel.txt | python3 witchie_solver_cli_v2.py --time-limit 60 > resultado.json
+
+Os módulos do solucionador e do visualizador só são importados depois da leitura
+dos argumentos, para que cada chamada em pipelines comece o mais rápido possível.
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+
+# Algoritmos disponíveis: nome na linha de comando -> método do solucionador
+ALGORITHMS = {
+    "a_star": "solve_a_star",
+    "bfs": "solve_bfs",
+    "decomposed": "solve_decomposed",
+    "push": "solve_push_search",
+}
+
+# Algoritmos que aceitam checkpoints
+CHECKPOINT_ALGORITHMS = ("a_star", "bfs")
+
+def parse_args(argv=None):
+    """
+    Lê os argumentos da linha de comando.
+    
+    Args:
+        argv (list): Argumentos (por padrão, sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: Argumentos lidos
+    """
+    parser = argparse.ArgumentParser(
+        description="Resolve um nível do jogo Witchie sem interação.")
+    parser.add_argument("level_file", nargs="?", default="-",
+                        help="arquivo do nível, com os símbolos separados por espaço "
+                             "(use - ou omita para ler da entrada padrão)")
+    parser.add_argument("--level-number", type=int,
+                        help="usa um nível predefinido em vez de um arquivo")
+    parser.add_argument("--algorithm", choices=sorted(ALGORITHMS), default="a_star",
+                        help="algoritmo de busca (padrão: a_star)")
+    parser.add_argument("--time-limit", type=float, default=300,
+                        help="tempo máximo de busca em segundos (padrão: 300)")
+    parser.add_argument("--checkpoint",
+                        help="arquivo onde o estado da busca é salvo ao atingir o tempo limite "
+                             "(apenas a_star e bfs)")
+    parser.add_argument("--checkpoint-interval", type=float,
+                        help="também salva o checkpoint a cada intervalo, em segundos de busca")
+    parser.add_argument("--resume",
+                        help="checkpoint a partir do qual a busca é retomada (apenas a_star e bfs)")
+    parser.add_argument("--format", choices=("json", "text"), default="json",
+                        help="formato da saída (padrão: json)")
+    parser.add_argument("--visualize", action="store_true",
+                        help="reproduz a solução no terminal depois de resolver")
+    
+    args = parser.parse_args(argv)
+    if (args.checkpoint or args.resume) and args.algorithm not in CHECKPOINT_ALGORITHMS:
+        parser.error("--checkpoint e --resume só podem ser usados com a_star ou bfs")
+    if args.checkpoint_interval is not None and not args.checkpoint:
+        parser.error("--checkpoint-interval exige --checkpoint")
+    return args
+
+def read_level(args):
+    """
+    Carrega o nível pedido nos argumentos.
+    
+    Args:
+        args (argparse.Namespace): Argumentos lidos
+        
+    Returns:
+        tuple: (level_map, level_offset)
+        
+    Raises:
+        ValueError: Se o nível não existir ou for inválido
+    """
+    from witchie_solver_levels_v2 import load_predefined_level, parse_level
+    
+    if args.level_number is not None:
+        # A mensagem de erro de load_predefined_level é substituída pela exceção abaixo
+        with contextlib.redirect_stdout(io.StringIO()):
+            level_map, level_offset = load_predefined_level(args.level_number)
+        if level_map is None:
+            raise ValueError(f"Nível {args.level_number} não encontrado.")
+        return level_map, level_offset
+    
+    if args.level_file == "-":
+        return parse_level(sys.stdin.read())
+    with open(args.level_file, encoding="utf-8") as f:
+        return parse_level(f.read())
+
+def solve(level_map, level_offset, args):
+    """
+    Resolve o nível com o algoritmo escolhido.
+    
+    As mensagens de progresso do solucionador vão para a saída de erro, para não
+    misturar com o resultado.
+    
+    Args:
+        level_map (list): Lista de strings representando o mapa do nível
+        level_offset (int): Largura do nível (número de colunas)
+        args (argparse.Namespace): Argumentos lidos
+        
+    Returns:
+        dict: Resultado com a solução e as estatísticas da busca
+    """
+    from witchie_solver_v2 import WitchieSolverV2
+    
+    start_time = time.time()
+    solver = WitchieSolverV2(level_map, level_offset)
+    method = getattr(solver, ALGORITHMS[args.algorithm])
+    
+    options = {"time_limit": args.time_limit}
+    if args.algorithm in CHECKPOINT_ALGORITHMS:
+        options["checkpoint_path"] = args.checkpoint
+        options["checkpoint_interval"] = args.checkpoint_interval
+        options["resume_from"] = args.resume
+    
+    with contextlib.redirect_stdout(sys.stderr):
+        moves_count, path = method(**options)
+    
+    return {
+        "solved": moves_count is not None,
+        "moves": moves_count,
+        "path": path,
+        "algorithm": args.algorithm,
+        # Só a BFS garante o mínimo: a heurística do A* pode superestimar, já que um
+        # deslizamento percorre várias casas com um único movimento
+        "optimal": args.algorithm == "bfs" and moves_count is not None,
+        "nodes_explored": solver.nodes_explored,
+        "elapsed": round(time.time() - start_time, 4),
+        "rows": len(level_map) // level_offset,
+        "columns": level_offset,
+    }
+
+def print_result(result, output_format):
+    """
+    Imprime o resultado na saída padrão.
+    
+    Args:
+        result (dict): Resultado devolvido por solve
+        output_format (str): "json" ou "text"
+    """
+    if output_format == "json":
+        print(json.dumps(result, ensure_ascii=False))
+        return
+    
+    if result["solved"]:
+        print(f"Número de movimentos: {result['moves']}")
+        print(f"Caminho: {' '.join(result['path'])}")
+    else:
+        print("Não foi possível encontrar uma solução.")
+    print(f"Nós explorados: {result['nodes_explored']}")
+    print(f"Tempo: {result['elapsed']:.2f} segundos")
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+    
+    Returns:
+        int: 0 se o nível foi resolvido, 1 se não houve solução, 2 em caso de erro
+    """
+    args = parse_args(argv)
+    
+    try:
+        level_map, level_offset = read_level(args)
+        result = solve(level_map, level_offset, args)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    
+    print_result(result, args.format)
+    
+    if args.visualize and result["solved"]:
+        from witchie_solver_visualizer_v2 import WitchieSolverVisualizerV2
+        
+        visualizer = WitchieSolverVisualizerV2(level_map, level_offset, result["path"])
+        with contextlib.redirect_stdout(sys.stderr):
+            visualizer.visualize_solution(auto_play=True)
+    
+    return 0 if result["solved"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,433 @@
+"""
+Gerador de níveis sintéticos do Witchie Solver V2.
+
+Os níveis são gerados por jogo reverso: partindo de um estado final (todas as
+caixas nos spots), o gerador aplica o inverso dos movimentos de define_movement
+(puxar uma caixa ou um crate, ou desfazer um deslizamento) e guarda a sequência
+de movimentos. Essa sequência, lida de trás para frente, é uma solução do nível e
+é conferida com o solucionador antes de o nível ser aceito, então todo nível
+gerado tem solução. O comprimento dessa solução é só um limite superior para o
+número mínimo de movimentos, porque o caminho gerado pode ter desvios; com
+--verify-nodes a profundidade real é calculada com BFS e usada como filtro.
+
+Exemplos:
+    python3 witchie_solver_generator_v2.py --count 1000 --seed 42 --output niveis.jsonl
+    python3 witchie_solver_generator_v2.py --rows 12 --cols 12 --boxes 4 --depth 40 --format text
+    python3 witchie_solver_generator_v2.py --count 100 --depth 15 --verify-nodes 200000
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+from witchie_solver_v2 import WitchieSolverV2
+
+WALL = WitchieSolverV2.WALL
+BOX = WitchieSolverV2.BOX
+PERSON = WitchieSolverV2.PERSON
+GRASS = WitchieSolverV2.GRASS
+SPOT = WitchieSolverV2.SPOT
+CRATE = WitchieSolverV2.CRATE
+HOLE = WitchieSolverV2.HOLE
+
+# Número de layouts tentados antes de desistir de um nível
+MAX_ATTEMPTS = 50
+
+# Limite de nós da busca reversa por movimento pedido
+NODES_PER_MOVE = 20
+
+def build_layout(rng, rows, cols, wall_density, hole_density):
+    """
+    Cria um layout aleatório cercado por paredes.
+
+    Args:
+        rng (random.Random): Gerador de números aleatórios
+        rows (int): Número de linhas
+        cols (int): Número de colunas
+        wall_density (float): Fração das casas internas que viram parede
+        hole_density (float): Fração das casas internas que viram buraco
+
+    Returns:
+        list: Mapa apenas com paredes, buracos e grama
+    """
+    layout = []
+    for row in range(rows):
+        for col in range(cols):
+            if row in (0, rows - 1) or col in (0, cols - 1):
+                layout.append(WALL)
+                continue
+            roll = rng.random()
+            if roll < wall_density:
+                layout.append(WALL)
+            elif roll < wall_density + hole_density:
+                layout.append(HOLE)
+            else:
+                layout.append(GRASS)
+    return layout
+
+def get_largest_area(layout, cols):
+    """
+    Encontra a maior região conexa de grama do layout.
+
+    Objetos e jogador são colocados só nessa região, para que nenhum spot fique
+    isolado do resto do nível.
+
+    Args:
+        layout (list): Mapa apenas com paredes, buracos e grama
+        cols (int): Número de colunas
+
+    Returns:
+        list: Posições das casas da maior região
+    """
+    seen = set()
+    largest = []
+    for start, cell in enumerate(layout):
+        if cell != GRASS or start in seen:
+            continue
+        area = [start]
+        seen.add(start)
+        for current in area:
+            for neighbor in (current - cols, current + cols, current - 1, current + 1):
+                if layout[neighbor] == GRASS and neighbor not in seen:
+                    seen.add(neighbor)
+                    area.append(neighbor)
+        if len(area) > len(largest):
+            largest = area
+    return sorted(largest)
+
+def get_reverse_moves(state, position, offset_by_direction):
+    """
+    Lista os movimentos reversos possíveis a partir de um estado.
+
+    Um movimento reverso leva a um estado anterior a partir do qual o movimento
+    direto correspondente (segundo define_movement) chega ao estado atual.
+
+    Args:
+        state (list): Estado atual do mapa, sem o jogador
+        position (int): Posição atual do jogador
+        offset_by_direction (dict): Offset de cada direção
+
+    Returns:
+        tuple: (puxões, deslizamentos), com listas de (direção, posição anterior do jogador)
+    """
+    pulls = []
+    slides = []
+    for direction, offset in offset_by_direction.items():
+        behind = position - offset
+        ahead = position + offset
+
+        # Puxão: o jogador estava atrás e empurrou o objeto que agora está à frente
+        if state[behind] == GRASS and (state[ahead] == BOX or state[ahead] == CRATE):
+            pulls.append((direction, behind))
+
+        # Deslizamento: o jogador só para aqui se a casa à frente não for grama
+        if state[ahead] != GRASS:
+            cell = behind
+            while state[cell] == GRASS:
+                slides.append((direction, cell))
+                cell -= offset
+
+    return pulls, slides
+
+def get_reverse_reachable(state, position, offset_by_direction):
+    """
+    Calcula as casas de onde o jogador pode ter vindo apenas deslizando.
+
+    Args:
+        state (list): Estado atual do mapa, sem o jogador
+        position (int): Posição atual do jogador
+        offset_by_direction (dict): Offset de cada direção
+
+    Returns:
+        dict: Mapeia cada casa para (casa seguinte, direção do deslizamento que
+              leva até ela), ou None para a posição atual
+    """
+    parents = {position: None}
+    queue = [position]
+    for current in queue:
+        for direction, previous in get_reverse_moves(state, current, offset_by_direction)[1]:
+            if previous not in parents:
+                parents[previous] = (current, direction)
+                queue.append(previous)
+    return parents
+
+def get_pulls(state, cells, offset_by_direction):
+    """
+    Lista os puxões possíveis com o jogador em qualquer uma das casas dadas.
+
+    Args:
+        state (list): Estado atual do mapa, sem o jogador
+        cells (iterable): Casas onde o jogador pode estar
+        offset_by_direction (dict): Offset de cada direção
+
+    Returns:
+        list: Lista de (casa do jogador, direção, posição anterior do jogador)
+    """
+    return [(cell, direction, previous) for cell in cells if state[cell] == GRASS
+            for direction, previous in get_reverse_moves(state, cell, offset_by_direction)[0]]
+
+def get_slide_path(parents, start):
+    """
+    Reconstrói os deslizamentos de uma casa até a raiz de get_reverse_reachable.
+
+    Args:
+        parents (dict): Casas alcançáveis, como devolvidas por get_reverse_reachable
+        start (int): Casa de onde o jogador parte
+
+    Returns:
+        list: Direções dos deslizamentos, na ordem em que são jogados
+    """
+    path = []
+    while parents[start] is not None:
+        start, direction = parents[start]
+        path.append(direction)
+    return path
+
+def search_reverse_play(rng, state, spots, free, offset_by_direction, depth):
+    """
+    Busca em profundidade, com retrocesso, uma sequência de puxões a partir do estado final.
+
+    Cada puxão desfaz um empurrão. Ele só é aceito se, depois do empurrão, o
+    jogador conseguir deslizar até a casa de onde parte o empurrão seguinte
+    (target); como poucas casas levam a uma casa específica deslizando, a busca
+    volta atrás quando fica sem puxões válidos.
+
+    Args:
+        rng (random.Random): Gerador de números aleatórios
+        state (list): Estado final, sem o jogador
+        spots (list): Posições dos spots (ocupados pelas caixas no estado final)
+        free (list): Casas onde o jogador e os objetos podem estar
+        offset_by_direction (dict): Offset de cada direção
+        depth (int): Número mínimo de movimentos
+
+    Returns:
+        tuple: (estado inicial sem o jogador, casa do primeiro empurrão, movimentos do
+               último para o primeiro) ou None se o limite de nós for atingido
+    """
+    budget = NODES_PER_MOVE * (depth + len(spots))
+    # Cada quadro: (estado, target, movimentos do último para o primeiro, caixas em spots, puxões)
+    stack = [(state, None, [], len(spots), None)]
+    while stack and budget > 0:
+        state, target, reverse_path, boxes_on_spots, pulls = stack[-1]
+        if len(reverse_path) >= depth and boxes_on_spots == 0:
+            return state, target, reverse_path
+
+        if pulls is None:
+            if target is None:
+                parents = None
+                pulls = get_pulls(state, free, offset_by_direction)
+            else:
+                parents = get_reverse_reachable(state, target, offset_by_direction)
+                pulls = get_pulls(state, parents, offset_by_direction)
+            rng.shuffle(pulls)
+            # Tirar uma caixa do seu spot tem prioridade (os últimos da lista saem primeiro)
+            pulls.sort(key=lambda pull: pull[0] + offset_by_direction[pull[1]] in spots)
+            stack[-1] = (state, target, reverse_path, boxes_on_spots, (pulls, parents))
+        else:
+            pulls, parents = pulls
+
+        if not pulls:
+            stack.pop()
+            continue
+        cell, direction, previous = pulls.pop()
+        budget -= 1
+
+        # Deslizamentos entre este empurrão e o seguinte, depois o próprio empurrão
+        new_path = reverse_path.copy()
+        if parents is not None:
+            new_path += get_slide_path(parents, cell)[::-1]
+        new_path.append(direction)
+
+        # Puxa o objeto da frente para a casa do jogador
+        new_state = state.copy()
+        obj = cell + offset_by_direction[direction]
+        new_state[cell] = new_state[obj]
+        new_state[obj] = SPOT if obj in spots else GRASS
+        stack.append((new_state, previous, new_path, boxes_on_spots - (obj in spots), None))
+
+    return None
+
+def generate_level(seed, rows=8, cols=8, boxes=2, crate_density=0.0, hole_density=0.0,
+                   wall_density=0.15, depth=20, verify_nodes=None):
+    """
+    Gera um nível com solução garantida por jogo reverso.
+
+    O mesmo seed sempre gera o mesmo nível. Sem verify_nodes, depth limita apenas o
+    comprimento do caminho gerado; com verify_nodes, o nível só é aceito se a BFS
+    (limitada a esse número de nós, e não a um tempo, para manter o determinismo)
+    confirmar que a solução mínima tem pelo menos depth movimentos.
+
+    Args:
+        seed (int or str): Semente do gerador de números aleatórios
+        rows (int): Número de linhas (incluindo as paredes da borda)
+        cols (int): Número de colunas (incluindo as paredes da borda)
+        boxes (int): Número de caixas (e de spots)
+        crate_density (float): Fração das casas livres ocupadas por crates
+        hole_density (float): Fração das casas internas que viram buraco
+        wall_density (float): Fração das casas internas que viram parede
+        depth (int): Número mínimo de movimentos do caminho gerado (ou da solução
+            mínima, com verify_nodes)
+        verify_nodes (int): Limite de nós da BFS que calcula a solução mínima
+
+    Returns:
+        tuple: (level_map, level_offset, solução gerada, número mínimo de movimentos ou
+               None se não foi calculado) ou (None, None, None, None) se não for
+               possível gerar o nível com esses parâmetros
+    """
+    rng = random.Random(seed)
+    offset_by_direction = {"up": -cols, "down": cols, "left": -1, "right": 1}
+
+    for _ in range(MAX_ATTEMPTS):
+        layout = build_layout(rng, rows, cols, wall_density, hole_density)
+        free = get_largest_area(layout, cols)
+        crates = int(len(free) * crate_density)
+        if len(free) < boxes + crates + 1:
+            continue
+
+        # Estado final: caixas sobre os spots e crates em casas livres
+        cells = rng.sample(free, boxes + crates)
+        spots = cells[:boxes]
+        state = layout.copy()
+        for cell in spots:
+            state[cell] = BOX
+        for cell in cells[boxes:boxes + crates]:
+            state[cell] = CRATE
+
+        result = search_reverse_play(rng, state, spots, free, offset_by_direction, depth)
+        if result is None:
+            continue
+        state, target, reverse_path = result
+
+        # O jogador começa em alguma casa de onde consegue deslizar até o primeiro empurrão
+        parents = get_reverse_reachable(state, target, offset_by_direction)
+        position = rng.choice(sorted(parents))
+        reverse_path += get_slide_path(parents, position)[::-1]
+
+        # Confere a solução com as regras do solucionador
+        state[position] = PERSON
+        solution = reverse_path[::-1]
+        solver = WitchieSolverV2(state, cols)
+        final_state, _ = solver.apply_path(state.copy(), position, solution)
+        if not solver.is_level_completed(final_state):
+            continue
+        if verify_nodes is None:
+            return state, cols, solution, None
+
+        # Profundidade real: níveis rasos demais (ou grandes demais para a BFS) são descartados
+        optimal_moves, _ = solver.solve_bfs(time_limit=float("inf"), max_nodes=verify_nodes,
+                                            verbose=False)
+        if optimal_moves is not None and optimal_moves >= depth:
+            return state, cols, solution, optimal_moves
+
+    return None, None, None, None
+
+def format_level(level_map, level_offset):
+    """
+    Converte um nível para o formato de texto lido por parse_level.
+
+    Args:
+        level_map (list): Lista de strings representando o mapa do nível
+        level_offset (int): Largura do nível (número de colunas)
+
+    Returns:
+        str: Uma linha do mapa por linha de texto, com os símbolos separados por espaço
+    """
+    return "\n".join(" ".join(level_map[i:i + level_offset])
+                     for i in range(0, len(level_map), level_offset))
+
+def parse_args(argv=None):
+    """
+    Lê os argumentos da linha de comando.
+
+    Args:
+        argv (list): Argumentos (por padrão, sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Argumentos lidos
+    """
+    parser = argparse.ArgumentParser(
+        description="Gera níveis do jogo Witchie com solução garantida.")
+    parser.add_argument("--rows", type=int, default=8, help="número de linhas (padrão: 8)")
+    parser.add_argument("--cols", type=int, default=8, help="número de colunas (padrão: 8)")
+    parser.add_argument("--boxes", type=int, default=2, help="número de caixas (padrão: 2)")
+    parser.add_argument("--crate-density", type=float, default=0.0,
+                        help="fração das casas livres com crates (padrão: 0)")
+    parser.add_argument("--hole-density", type=float, default=0.0,
+                        help="fração das casas internas com buracos (padrão: 0)")
+    parser.add_argument("--wall-density", type=float, default=0.15,
+                        help="fração das casas internas com paredes (padrão: 0.15)")
+    parser.add_argument("--depth", type=int, default=20,
+                        help="número mínimo de movimentos do caminho gerado ou, com "
+                             "--verify-nodes, da solução mínima (padrão: 20)")
+    parser.add_argument("--verify-nodes", type=int,
+                        help="calcula a solução mínima com uma BFS limitada a esse número "
+                             "de nós e descarta níveis mais rasos que --depth")
+    parser.add_argument("--count", type=int, default=1, help="número de níveis (padrão: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="semente inicial (padrão: 0)")
+    parser.add_argument("--output", help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--format", choices=("jsonl", "text"), default="jsonl",
+                        help="jsonl (um nível por linha) ou text (níveis separados por "
+                             "linha em branco); padrão: jsonl")
+
+    args = parser.parse_args(argv)
+    if args.rows < 3 or args.cols < 3:
+        parser.error("--rows e --cols devem ser pelo menos 3")
+    if args.boxes < 1:
+        parser.error("--boxes deve ser pelo menos 1")
+    if args.depth < 1:
+        parser.error("--depth deve ser pelo menos 1")
+    if args.verify_nodes is not None and args.verify_nodes < 1:
+        parser.error("--verify-nodes deve ser pelo menos 1")
+    if args.wall_density + args.hole_density >= 1:
+        parser.error("a soma de --wall-density e --hole-density deve ser menor que 1")
+    return args
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando.
+
+    Returns:
+        int: 0 se todos os níveis foram gerados, 1 caso contrário
+    """
+    args = parse_args(argv)
+    start_time = time.time()
+    generated = 0
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for index in range(args.count):
+            # Cada nível tem sua própria semente, para poder ser gerado de novo isoladamente
+            seed = f"{args.seed}:{index}"
+            level_map, level_offset, solution, optimal_moves = generate_level(
+                seed, args.rows, args.cols, args.boxes, args.crate_density,
+                args.hole_density, args.wall_density, args.depth, args.verify_nodes)
+            if level_map is None:
+                print(f"Não foi possível gerar o nível {index} (semente {seed})", file=sys.stderr)
+                continue
+
+            level_text = format_level(level_map, level_offset)
+            if args.format == "jsonl":
+                output.write(json.dumps({
+                    "seed": seed,
+                    "rows": len(level_map) // level_offset,
+                    "columns": level_offset,
+                    "boxes": args.boxes,
+                    "solution_length": len(solution),
+                    "solution": solution,
+                    "optimal_moves": optimal_moves,
+                    "level": level_text,
+                }, ensure_ascii=False) + "\n")
+            else:
+                output.write(level_text + "\n\n")
+            generated += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.time() - start_time
+    print(f"{generated} níveis gerados em {elapsed:.2f} segundos", file=sys.stderr)
+    return 0 if generated == args.count else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
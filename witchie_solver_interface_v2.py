@@ -1,5 +1,10 @@
+import os
 import sys
 from witchie_solver_v2 import WitchieSolverV2
+from witchie_solver_levels_v2 import load_predefined_level
+
+# Arquivo onde o estado de buscas interrompidas pelo tempo limite é salvo
+CHECKPOINT_FILE = "witchie_checkpoint.json.gz"
 
 def print_level(level_map, level_offset):
     """
@@ -67,76 +72,6 @@ def define_level():
         print("Erro: Por favor, insira números válidos.")
         return define_level()
 
-def load_predefined_level(level_number):
-    """
-    Carrega um nível predefinido.
-    
-    Args:
-        level_number (int): Número do nível a ser carregado
-        
-    Returns:
-        tuple: (level_map, level_offset)
-    """
-    if level_number == 1:
-        # Nível 1 do jogo
-        level_map = [
-                    
-                    # ⬛️ = wall, 📦 = box,  🙋🏿 = person,  ⬜️ = grass,   🔯 = plate.
-                    
-                    #nivel médio
-                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "🔯", "⬛️", "🔯", "⬜️", "⬛️",
-                    "⬛️", "📦", "⬜️", "📦", "⬜️", "📦", "⬜️", "⬛️",
-                    "⬛️", "🔯", "🙋🏿", "⬜️", "⬜️", "⬜️", "📦", "⬛️",
-                    "⬛️", "⬛️", "⬛️", "⬜️", "⬛️", "⬜️", "🔯", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️", "⬛️",
-                    "⬛️", "📦", "⬜️", "📦", "⬜️", "⬜️", "🔯", "⬛️",
-                    "⬛️", "🔯", "⬛️", "⬛️", "📦", "📦", "🔯", "⬛️",
-                    "⬛️", "⬛️", "⬛️", "⬛️", "🔯", "⬛️", "⬛️", "⬛️",
-                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "🟫", "🟫"
-                    
-                ]
-        level_offset = 8
-    elif level_number == 2:
-        # Nível 2 do jogo
-        level_map = [
-                    
-                    
-                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
-                    "⬛️", "🔯", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "🔯", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬛️", "⬜️", "📦", "🙋🏿", "📦", "⬜️", "⬛️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬛️", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
-                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "🔯", "⬛️",
-                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
-                    
-                ]
-        level_offset = 9
-    elif level_number == 3:
-        # Nível 3 do jogo
-        level_map = [
-            "🟫", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "🟫",
-            "⬛️", "⬛️", "⬜️", "📦", "⬜️", "🔯", "⬛️", "⬛️",
-            "⬛️", "⬜️", "⬜️", "⬛️", "⬛️", "⬛️", "🔯", "⬛️",
-            "⬛️", "⬜️", "⬛️", "⬛️", "🟫", "⬛️", "⬜️", "⬛️",
-            "⬛️", "⬜️", "⬛️", "🟫", "🟫", "⬛️", "⬜️", "⬛️",
-            "⬛️", "⬜️", "⬛️", "⬛️", "⬛️", "⬛️", "⬜️", "⬛️",
-            "⬛️", "⬜️", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬛️",
-            "⬛️", "🔯", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬛️",
-            "⬛️", "⬛️", "🔯", "⬜️", "📦", "🙋🏿", "⬜️", "⬛️",
-            "🟫", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️"
-        ]
-        level_offset = 8
-    else:
-        print(f"Erro: Nível {level_number} não encontrado.")
-        return None, None
-    
-    return level_map, level_offset
-
 def main():
     print("=== Witchie Solver V2 ===")
     print("Este programa encontra o número mínimo de movimentos para completar um nível do jogo Witchie.")
@@ -171,21 +106,71 @@ def main():
         print("Escolha o algoritmo:")
         print("1. A* (mais eficiente para níveis complexos)")
         print("2. BFS (mais simples, pode ser mais rápido para níveis pequenos)")
+        print("3. A* com decomposição (níveis com regiões independentes, solução não necessariamente mínima)")
+        print("4. Busca por empurrões (solução rápida, não necessariamente mínima)")
         
         algo_choice = input("\nEscolha uma opção: ")
         
-        if algo_choice == "1":
-            print("\nResolvendo usando A*...")
-            moves_count, path = solver.solve_a_star()
+        # Só o A* (também a opção padrão) e o BFS salvam e retomam checkpoints
+        if algo_choice in ("3", "4"):
+            checkpoint_algorithm = None
         elif algo_choice == "2":
-            print("\nResolvendo usando BFS...")
-            moves_count, path = solver.solve_bfs()
+            checkpoint_algorithm = "bfs"
         else:
-            print("Opção inválida. Usando A* por padrão...")
-            moves_count, path = solver.solve_a_star()
+            checkpoint_algorithm = "a_star"
+        
+        resume_from = None
+        if checkpoint_algorithm is not None and solver.is_checkpoint_for(CHECKPOINT_FILE, checkpoint_algorithm):
+            if input(f"Retomar a busca salva em {CHECKPOINT_FILE}? (s/n): ").strip().lower() == "s":
+                resume_from = CHECKPOINT_FILE
+        
+        # Por padrão o checkpoint só é gravado quando o tempo limite é atingido
+        checkpoint_interval = None
+        if checkpoint_algorithm is not None:
+            interval = input("Intervalo entre checkpoints periódicos em segundos "
+                             "(Enter para salvar apenas no tempo limite): ").strip()
+            if interval:
+                try:
+                    checkpoint_interval = float(interval)
+                except ValueError:
+                    print("Intervalo inválido. Salvando apenas no tempo limite.")
+        
+        try:
+            if algo_choice == "1":
+                print("\nResolvendo usando A*...")
+                moves_count, path = solver.solve_a_star(checkpoint_path=CHECKPOINT_FILE,
+                                                        checkpoint_interval=checkpoint_interval,
+                                                        resume_from=resume_from)
+            elif algo_choice == "2":
+                print("\nResolvendo usando BFS...")
+                moves_count, path = solver.solve_bfs(checkpoint_path=CHECKPOINT_FILE,
+                                                     checkpoint_interval=checkpoint_interval,
+                                                     resume_from=resume_from)
+            elif algo_choice == "3":
+                print("\nResolvendo usando A* com decomposição...")
+                moves_count, path = solver.solve_decomposed()
+            elif algo_choice == "4":
+                print("\nResolvendo usando busca por empurrões...")
+                moves_count, path = solver.solve_push_search()
+            else:
+                print("Opção inválida. Usando A* por padrão...")
+                moves_count, path = solver.solve_a_star(checkpoint_path=CHECKPOINT_FILE,
+                                                        checkpoint_interval=checkpoint_interval,
+                                                        resume_from=resume_from)
+        except ValueError as e:
+            print(f"Erro ao retomar a busca: {e}")
+            continue
         
         if moves_count is not None:
-            print(f"\nNúmero mínimo de movimentos: {moves_count}")
+            # A busca deste nível terminou, então o checkpoint dela não é mais necessário
+            if checkpoint_algorithm is not None and solver.is_checkpoint_for(CHECKPOINT_FILE, checkpoint_algorithm):
+                os.remove(CHECKPOINT_FILE)
+            
+            # Só a BFS garante o número mínimo de movimentos
+            if algo_choice == "2":
+                print(f"\nNúmero mínimo de movimentos: {moves_count}")
+            else:
+                print(f"\nNúmero de movimentos: {moves_count}")
             print_solution(path)
         else:
             print("\nNão foi possível encontrar uma solução.")
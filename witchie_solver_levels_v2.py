@@ -0,0 +1,115 @@
+from witchie_solver_v2 import WitchieSolverV2
+
+# Símbolos aceitos em um nível
+SYMBOLS = (
+    WitchieSolverV2.WALL, WitchieSolverV2.BOX, WitchieSolverV2.PERSON, WitchieSolverV2.GRASS,
+    WitchieSolverV2.SPOT, WitchieSolverV2.CRATE, WitchieSolverV2.HOLE, WitchieSolverV2.EMPTY,
+)
+
+def parse_level(text):
+    """
+    Converte o texto de um nível no formato usado pelo solucionador.
+    
+    Cada linha não vazia é uma linha do mapa, com os símbolos separados por espaço
+    (o mesmo formato usado para definir níveis manualmente na interface).
+    
+    Args:
+        text (str): Conteúdo do arquivo do nível
+        
+    Returns:
+        tuple: (level_map, level_offset)
+        
+    Raises:
+        ValueError: Se o nível estiver vazio, as linhas tiverem tamanhos diferentes,
+                    houver símbolos desconhecidos ou não houver exatamente um personagem
+    """
+    rows = [line.split() for line in text.splitlines() if line.strip()]
+    if not rows:
+        raise ValueError("O nível está vazio.")
+    
+    level_offset = len(rows[0])
+    level_map = []
+    for i, row in enumerate(rows):
+        if len(row) != level_offset:
+            raise ValueError(f"A linha {i+1} deve ter {level_offset} elementos.")
+        for j, symbol in enumerate(row):
+            # O solucionador trataria um símbolo desconhecido como uma barreira silenciosa
+            if symbol not in SYMBOLS:
+                raise ValueError(f"Símbolo desconhecido {symbol!r} na linha {i+1}, coluna {j+1}. "
+                                 f"Símbolos aceitos: {' '.join(SYMBOLS)}")
+        level_map.extend(row)
+    
+    if level_map.count(WitchieSolverV2.PERSON) != 1:
+        raise ValueError(f"O nível deve ter exatamente um personagem ({WitchieSolverV2.PERSON}).")
+    
+    return level_map, level_offset
+
+def load_predefined_level(level_number):
+    """
+    Carrega um nível predefinido.
+    
+    Args:
+        level_number (int): Número do nível a ser carregado
+        
+    Returns:
+        tuple: (level_map, level_offset)
+    """
+    if level_number == 1:
+        # Nível 1 do jogo
+        level_map = [
+                    
+                    # ⬛️ = wall, 📦 = box,  🙋🏿 = person,  ⬜️ = grass,   🔯 = plate.
+                    
+                    #nivel médio
+                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "🔯", "⬛️", "🔯", "⬜️", "⬛️",
+                    "⬛️", "📦", "⬜️", "📦", "⬜️", "📦", "⬜️", "⬛️",
+                    "⬛️", "🔯", "🙋🏿", "⬜️", "⬜️", "⬜️", "📦", "⬛️",
+                    "⬛️", "⬛️", "⬛️", "⬜️", "⬛️", "⬜️", "🔯", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️", "⬛️",
+                    "⬛️", "📦", "⬜️", "📦", "⬜️", "⬜️", "🔯", "⬛️",
+                    "⬛️", "🔯", "⬛️", "⬛️", "📦", "📦", "🔯", "⬛️",
+                    "⬛️", "⬛️", "⬛️", "⬛️", "🔯", "⬛️", "⬛️", "⬛️",
+                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "🟫", "🟫"
+                    
+                ]
+        level_offset = 8
+    elif level_number == 2:
+        # Nível 2 do jogo
+        level_map = [
+                    
+                    
+                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
+                    "⬛️", "🔯", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "🔯", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬛️", "⬜️", "📦", "🙋🏿", "📦", "⬜️", "⬛️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬛️", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬛️",
+                    "⬛️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "⬜️", "🔯", "⬛️",
+                    "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️",
+                    
+                ]
+        level_offset = 9
+    elif level_number == 3:
+        # Nível 3 do jogo
+        level_map = [
+            "🟫", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "🟫",
+            "⬛️", "⬛️", "⬜️", "📦", "⬜️", "🔯", "⬛️", "⬛️",
+            "⬛️", "⬜️", "⬜️", "⬛️", "⬛️", "⬛️", "🔯", "⬛️",
+            "⬛️", "⬜️", "⬛️", "⬛️", "🟫", "⬛️", "⬜️", "⬛️",
+            "⬛️", "⬜️", "⬛️", "🟫", "🟫", "⬛️", "⬜️", "⬛️",
+            "⬛️", "⬜️", "⬛️", "⬛️", "⬛️", "⬛️", "⬜️", "⬛️",
+            "⬛️", "⬜️", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬛️",
+            "⬛️", "🔯", "⬜️", "⬜️", "📦", "⬜️", "⬜️", "⬛️",
+            "⬛️", "⬛️", "🔯", "⬜️", "📦", "🙋🏿", "⬜️", "⬛️",
+            "🟫", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️", "⬛️"
+        ]
+        level_offset = 8
+    else:
+        print(f"Erro: Nível {level_number} não encontrado.")
+        return None, None
+    
+    return level_map, level_offset
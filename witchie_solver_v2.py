@@ -1,7 +1,11 @@
 import heapq
 import copy
-from collections import deque
+from collections import deque, OrderedDict
 import time
+import gzip
+import json
+import os
+import zlib
 
 class WitchieSolverV2:
     # Símbolos do jogo
@@ -14,19 +18,122 @@ class WitchieSolverV2:
     HOLE = "🕳️"
     EMPTY = "🟫"
 
-    def __init__(self, level_map, level_offset):
+    # Versão do formato dos arquivos de checkpoint
+    CHECKPOINT_VERSION = 2
+
+    # Códigos de uma letra usados para gravar os caminhos nos checkpoints
+    DIRECTION_CODES = {"up": "u", "down": "d", "left": "l", "right": "r"}
+
+    # Número máximo de layouts mantidos no cache de análise estática
+    LAYOUT_CACHE_SIZE = 256
+
+    # Cache compartilhado por todas as instâncias: layout -> análise estática (LRU)
+    _layout_cache = OrderedDict()
+
+    def __init__(self, level_map, level_offset, cache_layout=True):
         """
         Inicializa o solucionador com o mapa do nível e o offset (largura) do nível.
         
         Args:
             level_map (list): Lista de strings representando o mapa do nível
             level_offset (int): Largura do nível (número de colunas)
+            cache_layout (bool): Se False, a análise estática não é guardada no cache
+                compartilhado (para mapas derivados, usados uma única vez)
         """
         self.level_map = level_map
         self.level_offset = level_offset
-        self.spots_index = self.get_indexes_of(self.SPOT)
         self.start_position = self.get_indexes_of(self.PERSON)[0]
         
+        # Nós explorados pela última busca
+        self.nodes_explored = 0
+        
+        # Dados que dependem apenas das paredes, buracos e spots vêm do cache compartilhado
+        analysis = self.get_layout_analysis(level_map, level_offset, store=cache_layout)
+        self.base_map = analysis["base_map"]
+        self.spots_index = analysis["spots_index"]
+        self.dead_squares = analysis["dead_squares"]
+        self.push_zones = analysis["push_zones"]
+    
+    @classmethod
+    def get_layout_analysis(cls, level_map, level_offset, store=True):
+        """
+        Retorna a análise estática de um layout, calculando-a só na primeira vez.
+        
+        Níveis com as mesmas paredes, buracos e spots (mesmo com caixas em posições
+        diferentes) compartilham a mesma entrada. O cache guarda no máximo
+        LAYOUT_CACHE_SIZE layouts e descarta o usado há mais tempo.
+        
+        Args:
+            level_map (list): Lista de strings representando o mapa do nível
+            level_offset (int): Largura do nível (número de colunas)
+            store (bool): Se False, uma análise calculada agora não entra no cache
+            
+        Returns:
+            dict: base_map, spots_index, dead_squares e push_zones do layout.
+                  Os valores são compartilhados e não devem ser modificados.
+        """
+        # Mapa sem os elementos móveis (jogador, caixas e crates)
+        base_map = [cls.GRASS if x in (cls.PERSON, cls.BOX, cls.CRATE) else x for x in level_map]
+        key = (level_offset, tuple(base_map))
+        
+        analysis = cls._layout_cache.get(key)
+        if analysis is not None:
+            cls._layout_cache.move_to_end(key)
+            return analysis
+        
+        spots_index = [i for i, x in enumerate(base_map) if x == cls.SPOT]
+        analysis = {
+            "base_map": base_map,
+            "spots_index": spots_index,
+            "dead_squares": cls.find_dead_squares(base_map, level_offset, spots_index),
+            # Zonas de empurrões, preenchidas sob demanda por get_push_zone
+            "push_zones": {},
+        }
+        
+        if not store:
+            return analysis
+        
+        cls._layout_cache[key] = analysis
+        if len(cls._layout_cache) > cls.LAYOUT_CACHE_SIZE:
+            cls._layout_cache.popitem(last=False)
+        return analysis
+    
+    @classmethod
+    def find_dead_squares(cls, base_map, level_offset, spots_index):
+        """
+        Encontra as casas de grama das quais uma caixa nunca chega a um spot.
+        
+        Faz uma busca reversa a partir dos spots: uma caixa em uma casa alcança um
+        spot se puder ser empurrada para uma casa que já o alcança, com o jogador
+        parado em grama do lado oposto. Os demais objetos são ignorados.
+        
+        Args:
+            base_map (list): Mapa sem os elementos móveis
+            level_offset (int): Largura do nível (número de colunas)
+            spots_index (list): Posições dos spots
+            
+        Returns:
+            set: Posições das casas mortas
+        """
+        size = len(base_map)
+        live = set(spots_index)
+        queue = deque(spots_index)
+        while queue:
+            target = queue.popleft()
+            for offset in (-level_offset, level_offset, -1, 1):
+                cell, pusher = target - offset, target - 2 * offset
+                if not (0 <= cell < size and 0 <= pusher < size):
+                    continue
+                # Empurrões horizontais não podem atravessar linhas
+                if abs(offset) == 1 and (cell // level_offset != target // level_offset or
+                                         pusher // level_offset != target // level_offset):
+                    continue
+                if cell not in live and base_map[cell] == cls.GRASS and base_map[pusher] == cls.GRASS:
+                    live.add(cell)
+                    queue.append(cell)
+        
+        return {i for i, x in enumerate(base_map) if x == cls.GRASS and i not in live}
+        
     def get_indexes_of(self, element):
         """
         Retorna os índices de um elemento específico no mapa.
@@ -224,6 +331,10 @@ class WitchieSolverV2:
         # Verifica se alguma caixa está presa em um canto
         boxes = [i for i, x in enumerate(state) if x == self.BOX]
         
+        # Se todas as caixas precisam terminar em spots, nenhuma pode estar em uma casa morta
+        if len(boxes) <= len(self.spots_index) and any(box in self.dead_squares for box in boxes):
+            return True
+        
         for box in boxes:
             # Se a caixa já está em um spot, não é um deadlock
             if box in self.spots_index:
@@ -255,32 +366,274 @@ class WitchieSolverV2:
         
         return False
     
-    def solve_a_star(self):
+    def get_dynamic_elements(self, state):
+        """
+        Retorna as posições dos elementos móveis de um estado.
+        
+        Args:
+            state (list): Estado do mapa
+            
+        Returns:
+            tuple: (posições das caixas, posições dos crates)
+        """
+        boxes = [i for i, x in enumerate(state) if x == self.BOX]
+        crates = [i for i, x in enumerate(state) if x == self.CRATE]
+        return boxes, crates
+    
+    def build_state(self, position, boxes, crates):
+        """
+        Reconstrói um estado completo a partir das posições dos elementos móveis.
+        
+        Args:
+            position (int): Posição do jogador
+            boxes (list): Posições das caixas
+            crates (list): Posições dos crates
+            
+        Returns:
+            list: Estado do mapa
+        """
+        state = self.base_map.copy()
+        for box in boxes:
+            state[box] = self.BOX
+        for crate in crates:
+            state[crate] = self.CRATE
+        state[position] = self.PERSON
+        return state
+    
+    def get_moved_objects(self, state, position, direction, objects):
+        """
+        Atualiza as posições das caixas e dos crates depois de um movimento.
+        
+        Um deslizamento nunca move objetos e um empurrão move exatamente um, então
+        basta olhar a casa vizinha em vez de percorrer o mapa inteiro.
+        
+        Args:
+            state (list): Estado antes do movimento
+            position (int): Posição do jogador antes do movimento
+            direction (str): Direção do movimento
+            objects (tuple): (posições das caixas, posições dos crates) antes do movimento
+            
+        Returns:
+            tuple: (posições das caixas, posições dos crates) depois do movimento
+        """
+        if not self.is_push(state, position, direction):
+            return objects
+        
+        offset = self.get_direction_offset(direction)
+        source = position + offset
+        target = source + offset
+        boxes, crates = objects
+        if state[source] == self.BOX:
+            return tuple(target if box == source else box for box in boxes), crates
+        return boxes, tuple(target if crate == source else crate for crate in crates)
+    
+    def save_checkpoint(self, checkpoint_path, algorithm, frontier, visited, nodes_explored, elapsed):
+        """
+        Salva o estado de uma busca em um arquivo de checkpoint compacto.
+        
+        Os estados são gravados apenas pelas posições do jogador, das caixas e dos
+        crates, e os caminhos como strings de uma letra por direção. O arquivo é
+        gzip com uma linha JSON de cabeçalho (lida sozinha por is_checkpoint_for)
+        seguida de uma linha por entrada da fronteira e por estado visitado, gravadas
+        uma a uma sem montar uma cópia da busca inteira na memória.
+        
+        Args:
+            checkpoint_path (str): Caminho do arquivo de checkpoint
+            algorithm (str): "a_star" ou "bfs"
+            frontier (iterable): Fila de prioridade do A* ou fila do BFS, com as posições
+                dos objetos no fim de cada entrada
+            visited (list): Estados visitados, como (posição, (caixas, crates))
+            nodes_explored (int): Número de nós explorados até agora
+            elapsed (float): Tempo total de busca em segundos
+        """
+        header = {
+            "version": self.CHECKPOINT_VERSION,
+            "algorithm": algorithm,
+            "level_map": self.level_map,
+            "level_offset": self.level_offset,
+            "nodes_explored": nodes_explored,
+            "elapsed": elapsed,
+            "frontier_size": len(frontier),
+            "visited_size": len(visited),
+        }
+        
+        # Grava em um arquivo temporário e renomeia, para nunca deixar um checkpoint pela metade
+        temp_path = checkpoint_path + ".tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+            f.write(json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n")
+            
+            for entry in frontier:
+                # O A* guarda (f, g, posição, estado, caminho, objetos) e o BFS (posição, estado, caminho, objetos)
+                *costs, position, _, path, (boxes, crates) = entry
+                encoded_path = "".join(self.DIRECTION_CODES[direction] for direction in path)
+                f.write(json.dumps(costs + [position, boxes, crates, encoded_path], separators=(",", ":")) + "\n")
+            
+            for position, (boxes, crates) in visited:
+                f.write(json.dumps([position, boxes, crates], separators=(",", ":")) + "\n")
+        os.replace(temp_path, checkpoint_path)
+    
+    def read_checkpoint_header(self, checkpoint_file, algorithm):
+        """
+        Lê e confere o cabeçalho de um checkpoint aberto.
+        
+        Args:
+            checkpoint_file (file): Arquivo de checkpoint aberto em modo texto
+            algorithm (str): "a_star" ou "bfs"
+            
+        Returns:
+            dict: Cabeçalho do checkpoint
+            
+        Raises:
+            ValueError: Se o checkpoint for de outro nível, algoritmo ou versão, ou se
+                estiver corrompido
+        """
+        try:
+            header = json.loads(checkpoint_file.readline())
+            version = header.get("version")
+        except (ValueError, AttributeError) as e:
+            raise ValueError(f"Checkpoint inválido: {e}") from e
+        
+        if version != self.CHECKPOINT_VERSION:
+            raise ValueError("Versão de checkpoint não suportada.")
+        if header.get("algorithm") != algorithm:
+            raise ValueError(f"O checkpoint foi gerado pelo algoritmo {header.get('algorithm')}.")
+        if header.get("level_map") != self.level_map or header.get("level_offset") != self.level_offset:
+            raise ValueError("O checkpoint pertence a outro nível.")
+        return header
+    
+    def is_checkpoint_for(self, checkpoint_path, algorithm):
+        """
+        Indica se existe um checkpoint deste nível e algoritmo que possa ser retomado.
+        
+        Apenas o cabeçalho é lido, sem carregar a fronteira e os visitados.
+        
+        Args:
+            checkpoint_path (str): Caminho do arquivo de checkpoint
+            algorithm (str): "a_star" ou "bfs"
+            
+        Returns:
+            bool: True se o arquivo existir e o cabeçalho for compatível
+        """
+        try:
+            with gzip.open(checkpoint_path, "rt", encoding="utf-8") as f:
+                self.read_checkpoint_header(f, algorithm)
+        except (OSError, EOFError, zlib.error, ValueError):
+            return False
+        return True
+    
+    def load_checkpoint(self, checkpoint_path, algorithm):
+        """
+        Carrega o estado de uma busca salvo por save_checkpoint.
+        
+        Args:
+            checkpoint_path (str): Caminho do arquivo de checkpoint
+            algorithm (str): "a_star" ou "bfs"
+            
+        Returns:
+            tuple: (fronteira, conjunto de visitados, lista de visitados para novos
+                   checkpoints, nós explorados, tempo total)
+            
+        Raises:
+            ValueError: Se o checkpoint for de outro nível, algoritmo ou versão, ou se
+                estiver corrompido ou incompleto
+        """
+        directions = {code: direction for direction, code in self.DIRECTION_CODES.items()}
+        
+        with gzip.open(checkpoint_path, "rt", encoding="utf-8") as f:
+            # Erros de leitura daqui em diante indicam um arquivo truncado ou corrompido
+            try:
+                header = self.read_checkpoint_header(f, algorithm)
+                
+                frontier = []
+                for _ in range(header["frontier_size"]):
+                    *costs, position, boxes, crates, encoded_path = json.loads(f.readline())
+                    objects = (tuple(boxes), tuple(crates))
+                    state = self.build_state(position, *objects)
+                    path = [directions[code] for code in encoded_path]
+                    frontier.append(tuple(costs) + (position, state, path, objects))
+                
+                visited = set()
+                visited_log = []
+                for _ in range(header["visited_size"]):
+                    position, boxes, crates = json.loads(f.readline())
+                    objects = (tuple(boxes), tuple(crates))
+                    visited.add((position, tuple(self.build_state(position, *objects))))
+                    visited_log.append((position, objects))
+                
+                nodes_explored = header["nodes_explored"]
+                elapsed = header["elapsed"]
+            except (OSError, EOFError, zlib.error, KeyError, TypeError, IndexError) as e:
+                raise ValueError(f"Checkpoint corrompido ou incompleto: {e!r}") from e
+        
+        if algorithm == "a_star":
+            heapq.heapify(frontier)
+        else:
+            frontier = deque(frontier)
+        
+        return frontier, visited, visited_log, nodes_explored, elapsed
+    
+    def solve_a_star(self, time_limit=300, checkpoint_path=None, checkpoint_interval=None, resume_from=None,
+                     verbose=True):
         """
         Resolve o nível usando o algoritmo A*.
         
+        Args:
+            time_limit (float): Tempo máximo de busca nesta execução (em segundos)
+            checkpoint_path (str): Se informado, o estado da busca é salvo nesse arquivo
+                quando o tempo limite é atingido
+            checkpoint_interval (float): Se informado, também salva um checkpoint a cada
+                intervalo (em segundos de busca)
+            resume_from (str): Checkpoint a partir do qual a busca deve ser retomada
+            verbose (bool): Se False, não imprime o resumo da busca
+        
         Returns:
             tuple: (número de movimentos, caminho)
         """
         start_time = time.time()
         
-        # Estado inicial
-        initial_state = self.level_map.copy()
-        initial_position = self.start_position
-        
-        # Fila de prioridade para o A*
-        open_set = []
-        heapq.heappush(open_set, (0, 0, initial_position, initial_state, []))
+        if resume_from is not None:
+            # Retoma a fila de prioridade, os visitados e os contadores do checkpoint
+            open_set, closed_set, visited_log, nodes_explored, previous_elapsed = self.load_checkpoint(
+                resume_from, "a_star")
+            if verbose:
+                print(f"Busca retomada de {resume_from} ({nodes_explored} nós já explorados)")
+        else:
+            # Estado inicial
+            initial_state = self.level_map.copy()
+            initial_position = self.start_position
+            initial_objects = tuple(map(tuple, self.get_dynamic_elements(initial_state)))
+            
+            # Fila de prioridade para o A* (as posições dos objetos ficam no fim para os checkpoints)
+            open_set = []
+            heapq.heappush(open_set, (0, 0, initial_position, initial_state, [], initial_objects))
+            
+            # Conjunto de estados visitados e, para os checkpoints, a mesma lista em forma compacta
+            closed_set = set()
+            visited_log = []
+            
+            # Contador de nós explorados
+            nodes_explored = 0
+            previous_elapsed = 0
         
-        # Conjunto de estados visitados
-        closed_set = set()
+        # Só as posições dos objetos precisam ser acompanhadas quando há checkpoints
+        track_objects = checkpoint_path is not None
         
-        # Contador de nós explorados
-        nodes_explored = 0
+        # O tempo gasto gravando checkpoints não conta para o limite de busca
+        checkpoint_time = 0
+        last_checkpoint = start_time
         
-        while open_set and time.time() - start_time < 300:  # Limite de 5 minutos
+        while open_set and time.time() - start_time - checkpoint_time < time_limit:
+            # Salva um checkpoint periódico
+            if (track_objects and checkpoint_interval is not None and
+                    time.time() - last_checkpoint - checkpoint_time >= checkpoint_interval):
+                checkpoint_start = time.time()
+                self.save_checkpoint(checkpoint_path, "a_star", open_set, visited_log, nodes_explored,
+                                     previous_elapsed + checkpoint_start - start_time - checkpoint_time)
+                checkpoint_time += time.time() - checkpoint_start
+                last_checkpoint = checkpoint_start
+            
             # Obtém o estado com menor f(n) = g(n) + h(n)
-            f, g, position, state, path = heapq.heappop(open_set)
+            f, g, position, state, path, objects = heapq.heappop(open_set)
             
             # Converte o estado para uma tupla para poder ser usado como chave no conjunto
             state_tuple = tuple(state)
@@ -291,14 +644,18 @@ class WitchieSolverV2:
             
             # Adiciona o estado ao conjunto de visitados
             closed_set.add((position, state_tuple))
+            if track_objects:
+                visited_log.append((position, objects))
             
             # Incrementa o contador de nós explorados
             nodes_explored += 1
             
             # Se o nível está completo, retorna o caminho
             if self.is_level_completed(state):
-                print(f"Solução encontrada em {time.time() - start_time:.2f} segundos")
-                print(f"Nós explorados: {nodes_explored}")
+                if verbose:
+                    print(f"Solução encontrada em {time.time() - start_time:.2f} segundos")
+                    print(f"Nós explorados: {nodes_explored}")
+                self.nodes_explored = nodes_explored
                 return len(path), path
             
             # Obtém os movimentos possíveis
@@ -323,37 +680,90 @@ class WitchieSolverV2:
                 
                 # Adiciona o novo estado à fila de prioridade
                 new_path = path + [direction]
-                heapq.heappush(open_set, (new_f, new_g, new_position, new_state, new_path))
+                new_objects = self.get_moved_objects(state, position, direction, objects) if track_objects else None
+                heapq.heappush(open_set, (new_f, new_g, new_position, new_state, new_path, new_objects))
         
-        print(f"Tempo limite excedido após {time.time() - start_time:.2f} segundos")
-        print(f"Nós explorados: {nodes_explored}")
+        search_time = time.time() - start_time - checkpoint_time
+        if verbose:
+            print(f"Tempo limite excedido após {search_time:.2f} segundos")
+            print(f"Nós explorados: {nodes_explored}")
+        
+        # Salva o estado da busca para que ela possa ser retomada depois
+        if open_set and checkpoint_path is not None:
+            self.save_checkpoint(checkpoint_path, "a_star", open_set, visited_log, nodes_explored,
+                                 previous_elapsed + search_time)
+            if verbose:
+                print(f"Estado da busca salvo em {checkpoint_path}")
+        
+        self.nodes_explored = nodes_explored
         return None, None
     
-    def solve_bfs(self):
+    def solve_bfs(self, time_limit=300, checkpoint_path=None, checkpoint_interval=None, resume_from=None,
+                  max_nodes=None, verbose=True):
         """
         Resolve o nível usando o algoritmo BFS (Breadth-First Search).
         Útil para níveis menores onde o A* pode ser muito complexo.
         
+        Args:
+            time_limit (float): Tempo máximo de busca nesta execução (em segundos)
+            checkpoint_path (str): Se informado, o estado da busca é salvo nesse arquivo
+                quando o tempo limite é atingido
+            checkpoint_interval (float): Se informado, também salva um checkpoint a cada
+                intervalo (em segundos de busca)
+            resume_from (str): Checkpoint a partir do qual a busca deve ser retomada
+            max_nodes (int): Se informado, a busca para depois de explorar esse número de
+                nós, o que torna o resultado independente da velocidade da máquina
+            verbose (bool): Se False, não imprime o resumo da busca
+        
         Returns:
             tuple: (número de movimentos, caminho)
         """
         start_time = time.time()
         
-        # Estado inicial
-        initial_state = self.level_map.copy()
-        initial_position = self.start_position
-        
-        # Fila para o BFS
-        queue = deque([(initial_position, initial_state, [])])
+        if resume_from is not None:
+            # Retoma a fila, os visitados e os contadores do checkpoint
+            queue, visited, visited_log, nodes_explored, previous_elapsed = self.load_checkpoint(
+                resume_from, "bfs")
+            if verbose:
+                print(f"Busca retomada de {resume_from} ({nodes_explored} nós já explorados)")
+        else:
+            # Estado inicial
+            initial_state = self.level_map.copy()
+            initial_position = self.start_position
+            initial_objects = tuple(map(tuple, self.get_dynamic_elements(initial_state)))
+            
+            # Fila para o BFS (as posições dos objetos ficam no fim para os checkpoints)
+            queue = deque([(initial_position, initial_state, [], initial_objects)])
+            
+            # Conjunto de estados visitados e, para os checkpoints, a mesma lista em forma compacta
+            visited = set()
+            visited_log = []
+            
+            # Contador de nós explorados
+            nodes_explored = 0
+            previous_elapsed = 0
         
-        # Conjunto de estados visitados
-        visited = set()
+        # Só as posições dos objetos precisam ser acompanhadas quando há checkpoints
+        track_objects = checkpoint_path is not None
         
-        # Contador de nós explorados
-        nodes_explored = 0
+        # O tempo gasto gravando checkpoints não conta para o limite de busca
+        checkpoint_time = 0
+        last_checkpoint = start_time
         
-        while queue and time.time() - start_time < 300:  # Limite de 5 minutos
-            position, state, path = queue.popleft()
+        while queue and time.time() - start_time - checkpoint_time < time_limit:
+            if max_nodes is not None and nodes_explored >= max_nodes:
+                break
+            
+            # Salva um checkpoint periódico
+            if (track_objects and checkpoint_interval is not None and
+                    time.time() - last_checkpoint - checkpoint_time >= checkpoint_interval):
+                checkpoint_start = time.time()
+                self.save_checkpoint(checkpoint_path, "bfs", queue, visited_log, nodes_explored,
+                                     previous_elapsed + checkpoint_start - start_time - checkpoint_time)
+                checkpoint_time += time.time() - checkpoint_start
+                last_checkpoint = checkpoint_start
+            
+            position, state, path, objects = queue.popleft()
             
             # Converte o estado para uma tupla para poder ser usado como chave no conjunto
             state_tuple = tuple(state)
@@ -364,14 +774,18 @@ class WitchieSolverV2:
             
             # Adiciona o estado ao conjunto de visitados
             visited.add((position, state_tuple))
+            if track_objects:
+                visited_log.append((position, objects))
             
             # Incrementa o contador de nós explorados
             nodes_explored += 1
             
             # Se o nível está completo, retorna o caminho
             if self.is_level_completed(state):
-                print(f"Solução encontrada em {time.time() - start_time:.2f} segundos")
-                print(f"Nós explorados: {nodes_explored}")
+                if verbose:
+                    print(f"Solução encontrada em {time.time() - start_time:.2f} segundos")
+                    print(f"Nós explorados: {nodes_explored}")
+                self.nodes_explored = nodes_explored
                 return len(path), path
             
             # Obtém os movimentos possíveis
@@ -391,11 +805,405 @@ class WitchieSolverV2:
                 
                 # Adiciona o novo estado à fila
                 new_path = path + [direction]
-                queue.append((new_position, new_state, new_path))
+                new_objects = self.get_moved_objects(state, position, direction, objects) if track_objects else None
+                queue.append((new_position, new_state, new_path, new_objects))
+        
+        search_time = time.time() - start_time - checkpoint_time
+        if verbose:
+            if queue and max_nodes is not None and nodes_explored >= max_nodes:
+                print(f"Limite de nós atingido após {search_time:.2f} segundos")
+            else:
+                print(f"Tempo limite excedido após {search_time:.2f} segundos")
+            print(f"Nós explorados: {nodes_explored}")
+        
+        # Salva o estado da busca para que ela possa ser retomada depois
+        if queue and checkpoint_path is not None:
+            self.save_checkpoint(checkpoint_path, "bfs", queue, visited_log, nodes_explored,
+                                 previous_elapsed + search_time)
+            if verbose:
+                print(f"Estado da busca salvo em {checkpoint_path}")
+        
+        self.nodes_explored = nodes_explored
+        return None, None
+
+    def get_direction_offset(self, direction):
+        """
+        Retorna o offset correspondente a uma direção.
+        
+        Args:
+            direction (str): "up", "down", "left" ou "right"
+            
+        Returns:
+            int: Offset do movimento
+        """
+        return {
+            "up": -self.level_offset,
+            "down": self.level_offset,
+            "left": -1,
+            "right": 1
+        }[direction]
+    
+    def apply_path(self, state, position, path):
+        """
+        Aplica uma sequência de direções a um estado usando a lógica do jogo.
+        
+        Args:
+            state (list): Estado inicial do mapa
+            position (int): Posição inicial do jogador
+            path (list): Lista de direções
+            
+        Returns:
+            tuple: (estado_final, posição_final)
+        """
+        for direction in path:
+            state, position = self.define_movement(state, position, self.get_direction_offset(direction))
+        return state, position
+    
+    def get_push_zone(self, start):
+        """
+        Calcula as casas que um objeto móvel pode ocupar ao ser empurrado,
+        ignorando os demais objetos do mapa (sobre-aproximação).
+        
+        Args:
+            start (int): Posição inicial da caixa ou do crate
+            
+        Returns:
+            tuple: (casas alcançáveis pelo objeto, casas de onde o jogador o empurra)
+        """
+        is_crate = self.level_map[start] == self.CRATE
+        
+        # A zona depende só do layout, então fica no cache compartilhado
+        cached = self.push_zones.get((start, is_crate))
+        if cached is not None:
+            return cached
+        
+        targets = (self.GRASS,) if is_crate else (self.GRASS, self.SPOT)
+        
+        zone = {start}
+        pushers = set()
+        stack = [start]
+        while stack:
+            cell = stack.pop()
+            
+            # Uma caixa em um spot não pode mais ser empurrada
+            if not is_crate and cell in self.spots_index:
+                continue
+            
+            for offset in (-self.level_offset, self.level_offset, -1, 1):
+                target, pusher = cell + offset, cell - offset
+                if not (0 <= target < len(self.level_map) and 0 <= pusher < len(self.level_map)):
+                    continue
+                # Movimentos horizontais não podem atravessar linhas
+                if abs(offset) == 1 and (target // self.level_offset != cell // self.level_offset or
+                                         pusher // self.level_offset != cell // self.level_offset):
+                    continue
+                if self.base_map[target] in targets and self.base_map[pusher] == self.GRASS:
+                    pushers.add(pusher)
+                    if target not in zone:
+                        zone.add(target)
+                        stack.append(target)
+        
+        self.push_zones[(start, is_crate)] = (zone, pushers)
+        return zone, pushers
+    
+    def find_independent_groups(self):
+        """
+        Divide as caixas, crates e spots do nível em grupos que não interagem.
+        
+        Dois objetos ficam no mesmo grupo quando um pode ocupar uma casa que o outro
+        também alcança ou de onde o jogador precisa empurrá-lo. Um spot pertence ao
+        grupo das caixas que conseguem alcançá-lo.
         
-        print(f"Tempo limite excedido após {time.time() - start_time:.2f} segundos")
-        print(f"Nós explorados: {nodes_explored}")
+        Returns:
+            list: Lista de conjuntos de casas (zona de empurrões de cada grupo),
+                  considerando apenas grupos que possuem spots
+        """
+        objects = [i for i, x in enumerate(self.level_map) if x in (self.BOX, self.CRATE)]
+        zones = {}
+        footprints = {}
+        for obj in objects:
+            zone, pushers = self.get_push_zone(obj)
+            zones[obj] = zone
+            footprints[obj] = zone | pushers
+        
+        # Union-find sobre os objetos
+        parent = {obj: obj for obj in objects}
+        
+        def find(obj):
+            while parent[obj] != obj:
+                parent[obj] = parent[parent[obj]]
+                obj = parent[obj]
+            return obj
+        
+        for i, a in enumerate(objects):
+            for b in objects[i + 1:]:
+                if zones[a] & footprints[b] or zones[b] & footprints[a]:
+                    parent[find(a)] = find(b)
+        
+        groups = {}
+        for obj in objects:
+            groups.setdefault(find(obj), set()).update(zones[obj])
+        
+        # Grupos sem spots (por exemplo, só com crates) não precisam ser resolvidos
+        return [zone for zone in groups.values() if any(spot in zone for spot in self.spots_index)]
+    
+    def solve_group(self, state, position, zone, time_limit):
+        """
+        Resolve apenas um grupo independente a partir de um estado.
+        
+        Os objetos e spots fora da zona do grupo são tratados como paredes: eles
+        também param o jogador, mas não podem ser empurrados nem precisam ser cobertos.
+        
+        Args:
+            state (list): Estado atual do mapa
+            position (int): Posição atual do jogador
+            zone (set): Casas que pertencem ao grupo
+            time_limit (float): Tempo máximo de busca (em segundos)
+            
+        Returns:
+            tuple: (número de movimentos, caminho)
+        """
+        masked_map = [
+            self.WALL if x in (self.BOX, self.CRATE, self.SPOT) and i not in zone else x
+            for i, x in enumerate(state)
+        ]
+        # O mapa mascarado depende da posição atual dos outros grupos, então não vale guardá-lo no cache
+        group_solver = WitchieSolverV2(masked_map, self.level_offset, cache_layout=False)
+        result = group_solver.solve_a_star(time_limit=time_limit, verbose=False)
+        self.nodes_explored += group_solver.nodes_explored
+        return result
+    
+    def solve_decomposed(self, time_limit=300, verbose=True):
+        """
+        Resolve o nível dividindo-o em sub-problemas independentes.
+        
+        Cada grupo de caixas e spots que não interage com os demais é resolvido por
+        uma busca A* menor, e os caminhos são concatenados (os movimentos de
+        deslocamento entre as regiões fazem parte da busca do grupo seguinte). Os
+        grupos são resolvidos na primeira ordem viável encontrada; se nenhuma
+        funcionar, é usada a busca A* completa. A solução encontrada é válida, mas não necessariamente mínima.
+        
+        Args:
+            time_limit (float): Tempo máximo de busca (em segundos)
+            verbose (bool): Se False, não imprime o andamento da busca
+            
+        Returns:
+            tuple: (número de movimentos, caminho)
+        """
+        start_time = time.time()
+        groups = self.find_independent_groups()
+        self.nodes_explored = 0
+        
+        if len(groups) > 1:
+            if verbose:
+                print(f"Nível dividido em {len(groups)} grupos independentes")
+            
+            state = self.level_map.copy()
+            position = self.start_position
+            path = []
+            pending = list(groups)
+            
+            # A cada etapa resolve o primeiro grupo pendente que tiver solução a partir do estado atual
+            while pending and time.time() - start_time < time_limit:
+                moves_count = None
+                for zone in pending:
+                    remaining = time_limit - (time.time() - start_time)
+                    if remaining <= 0:
+                        break
+                    moves_count, group_path = self.solve_group(state, position, zone, remaining)
+                    if moves_count is not None:
+                        break
+                else:
+                    break
+                
+                if moves_count is None:
+                    break
+                
+                state, position = self.apply_path(state, position, group_path)
+                path += group_path
+                pending.remove(zone)
+                if verbose:
+                    print(f"Grupo resolvido com {moves_count} movimentos ({len(groups) - len(pending)}/{len(groups)})")
+            
+            # Confere a solução completa com as regras do jogo
+            if self.is_level_completed(state):
+                if verbose:
+                    print(f"Solução por decomposição encontrada em {time.time() - start_time:.2f} segundos")
+                return len(path), path
+            
+            if verbose:
+                print("A decomposição não encontrou solução, usando a busca completa...")
+        
+        remaining = time_limit - (time.time() - start_time)
+        if remaining <= 0:
+            if verbose:
+                print(f"Tempo limite excedido após {time.time() - start_time:.2f} segundos")
+            return None, None
+        
+        # Sem grupos independentes (ou sem ordem válida): usa a busca completa
+        group_nodes = self.nodes_explored
+        result = self.solve_a_star(time_limit=remaining, verbose=verbose)
+        self.nodes_explored += group_nodes
+        return result
+
+    def is_push(self, state, position, direction):
+        """
+        Verifica se um movimento começa empurrando uma caixa ou um crate.
+        
+        Args:
+            state (list): Estado atual do mapa
+            position (int): Posição atual do jogador
+            direction (str): Direção do movimento
+            
+        Returns:
+            bool: True se a casa vizinha na direção do movimento for uma caixa ou um crate
+        """
+        target = position + self.get_direction_offset(direction)
+        return 0 <= target < len(state) and state[target] in (self.BOX, self.CRATE)
+    
+    def get_slide_reachable(self, state, position):
+        """
+        Calcula as posições que o jogador alcança sem empurrar nada.
+        
+        Args:
+            state (list): Estado do mapa sem o jogador (a casa dele como grama)
+            position (int): Posição inicial do jogador
+            
+        Returns:
+            dict: Mapeia cada posição alcançável para (posição anterior, direção),
+                  ou None para a posição inicial
+        """
+        parents = {position: None}
+        queue = deque([position])
+        while queue:
+            current = queue.popleft()
+            for new_position, _, direction in self.get_possible_moves(state, current):
+                if new_position in parents or self.is_push(state, current, direction):
+                    continue
+                parents[new_position] = (current, direction)
+                queue.append(new_position)
+        return parents
+    
+    def solve_push_search(self, time_limit=300, verbose=True):
+        """
+        Resolve o nível buscando apenas sobre os empurrões de caixas e crates.
+        
+        Cada nó representa uma configuração de caixas e crates junto com a região
+        que o jogador alcança deslizando sem empurrar nada. Como um deslizamento nem
+        sempre pode ser desfeito, duas posições do jogador podem alcançar regiões
+        diferentes, então o nó é identificado pela região inteira. A busca é gulosa
+        (ordenada pela heurística) e o caminho completo de direções é reconstruído no
+        final. A solução é válida, mas não necessariamente mínima.
+        
+        Args:
+            time_limit (float): Tempo máximo de busca (em segundos)
+            verbose (bool): Se False, não imprime o resumo da busca
+            
+        Returns:
+            tuple: (número de movimentos, caminho)
+        """
+        start_time = time.time()
+        
+        # Estado inicial sem o jogador
+        initial_state = self.level_map.copy()
+        initial_state[self.start_position] = self.GRASS
+        initial_position = self.start_position
+        
+        if self.is_level_completed(initial_state):
+            self.nodes_explored = 0
+            return 0, []
+        
+        initial_reachable = self.get_slide_reachable(initial_state, initial_position)
+        initial_key = (frozenset(initial_reachable), tuple(initial_state))
+        
+        # Fila de prioridade ordenada pela heurística (o contador desempata sem comparar estados)
+        counter = 0
+        open_set = [(0, counter, initial_key, initial_state, initial_position, initial_reachable)]
+        
+        # Para cada nó: (nó anterior, posição de onde o jogador empurrou, direção)
+        parents = {initial_key: None}
+        
+        # Contador de nós explorados
+        nodes_explored = 0
+        
+        while open_set and time.time() - start_time < time_limit:
+            _, _, key, state, position, reachable = heapq.heappop(open_set)
+            nodes_explored += 1
+            
+            for push_from in reachable:
+                for direction, offset in (("up", -self.level_offset), ("down", self.level_offset),
+                                          ("left", -1), ("right", 1)):
+                    if offset in (-1, 1) and push_from // self.level_offset != (push_from + offset) // self.level_offset:
+                        continue
+                    if not self.is_push(state, push_from, direction):
+                        continue
+                    
+                    new_state, new_position = self.define_movement(state, push_from, offset)
+                    if new_position == push_from or self.is_deadlock(new_state):
+                        continue
+                    new_state[new_position] = self.GRASS
+                    
+                    new_reachable = self.get_slide_reachable(new_state, new_position)
+                    new_key = (frozenset(new_reachable), tuple(new_state))
+                    if new_key in parents:
+                        continue
+                    parents[new_key] = (key, push_from, direction)
+                    
+                    if self.is_level_completed(new_state):
+                        path = self.rebuild_push_path(parents, new_key)
+                        if verbose:
+                            print(f"Solução encontrada em {time.time() - start_time:.2f} segundos")
+                            print(f"Nós explorados: {nodes_explored}")
+                        self.nodes_explored = nodes_explored
+                        return len(path), path
+                    
+                    counter += 1
+                    new_h = self.get_heuristic(new_state, new_position)
+                    heapq.heappush(open_set, (new_h, counter, new_key, new_state, new_position, new_reachable))
+        
+        if verbose:
+            print(f"Tempo limite excedido após {time.time() - start_time:.2f} segundos")
+            print(f"Nós explorados: {nodes_explored}")
+        self.nodes_explored = nodes_explored
         return None, None
+    
+    def rebuild_push_path(self, parents, key):
+        """
+        Reconstrói o caminho completo de direções a partir da cadeia de empurrões.
+        
+        Args:
+            parents (dict): Nós anteriores gerados por solve_push_search
+            key (tuple): Nó final
+            
+        Returns:
+            list: Lista de direções desde a posição inicial
+        """
+        pushes = []
+        while parents[key] is not None:
+            key, push_from, direction = parents[key]
+            pushes.append((push_from, direction))
+        pushes.reverse()
+        
+        state = self.level_map.copy()
+        state[self.start_position] = self.GRASS
+        position = self.start_position
+        path = []
+        
+        for push_from, direction in pushes:
+            # Caminho sem empurrões até a posição de onde o jogador empurra
+            reachable = self.get_slide_reachable(state, position)
+            slide_path = []
+            current = push_from
+            while reachable[current] is not None:
+                current, slide_direction = reachable[current]
+                slide_path.append(slide_direction)
+            path += reversed(slide_path)
+            
+            state, position = self.define_movement(state, push_from, self.get_direction_offset(direction))
+            state[position] = self.GRASS
+            path.append(direction)
+        
+        return path
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -418,7 +1226,7 @@ if __name__ == "__main__":
     moves_count, path = solver.solve_a_star()
     
     if moves_count is not None:
-        print(f"Número mínimo de movimentos: {moves_count}")
+        print(f"Número de movimentos: {moves_count}")
         print(f"Caminho: {path}")
     else:
         print("Não foi possível encontrar uma solução usando A*.")
@@ -1,6 +1,7 @@
 import time
 import os
 import platform
+import sys
 from witchie_solver_v2 import WitchieSolverV2
 
 class WitchieSolverVisualizerV2:
@@ -22,11 +23,15 @@ class WitchieSolverVisualizerV2:
     def clear_screen(self):
         """
         Limpa a tela do terminal.
+        
+        Fora do Windows a sequência de escape é escrita em sys.stdout, e não por um
+        processo filho, para que redirecionamentos da saída também valham para ela.
         """
         if platform.system() == "Windows":
             os.system("cls")
         else:
-            os.system("clear")
+            sys.stdout.write("\033[H\033[2J\033[3J")
+            sys.stdout.flush()
     
     def print_level(self, state):
         """
@@ -94,7 +99,7 @@ class WitchieSolverVisualizerV2:
         print("Visualização concluída!")
 
 def main():
-    from witchie_solver_interface_v2 import load_predefined_level, print_level
+    from witchie_solver_levels_v2 import load_predefined_level
     
     print("=== Witchie Solver Visualizer V2 ===")
     print("Este programa visualiza a solução de um nível do jogo Witchie passo a passo.")
@@ -113,7 +118,10 @@ def main():
             if level_map is None:
                 continue
             
-            print_level(level_map, level_offset)
+            print("\nMapa do nível:")
+            for i in range(0, len(level_map), level_offset):
+                print(" ".join(level_map[i:i+level_offset]))
+            print()
             
             solver = WitchieSolverV2(level_map, level_offset)
             
@@ -134,7 +142,11 @@ def main():
                 moves_count, path = solver.solve_a_star()
             
             if moves_count is not None:
-                print(f"\nNúmero mínimo de movimentos: {moves_count}")
+                # Só a BFS garante o número mínimo de movimentos
+                if algo_choice == "2":
+                    print(f"\nNúmero mínimo de movimentos: {moves_count}")
+                else:
+                    print(f"\nNúmero de movimentos: {moves_count}")
                 
                 visualizer = WitchieSolverVisualizerV2(level_map, level_offset, path)
                 